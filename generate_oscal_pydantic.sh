@@ -11,8 +11,22 @@ for PYDANTIC_MODEL in src/oscal_pydantic/*.py
     do
         # Invalid REGEX pattern 
         # ^(\\p{L}|_)(\\p{L}|\\p{N}|[.\\-_])*$ - replace with 
-        # ^(\\w|_)(\\w|\\d|[.\\--_])*$
-        sed -i 's=^(\\p{L}|_)(\\p{L}|\\p{N}|[.\\-_])*$=^(\\w|_)(\\w|\\d|[.\\--_])*$=' $PYDANTIC_MODEL
+        # ^[^\\W\\d][\\w.\\-]*$ (a letter or underscore, then letters, digits, '.', '-' or '_')
+        sed -i 's=\^(\\\\p{L}|_)(\\\\p{L}|\\\\p{N}|\[\.\\\\-_\])\*\$=^[^\\\\W\\\\d][\\\\w.\\\\-]*$=' $PYDANTIC_MODEL
+
+        # The date-with-timezone pattern only anchors its first and last
+        # alternatives - group the alternatives so ^ and $ (and the timezone
+        # suffix) apply to all of them
+        sed -i '/30))(Z|/ { s/"^((2000/"^(((2000/; s/30))(Z|/30)))(Z|/ }' $PYDANTIC_MODEL
+
+        # Validate email addresses with the OSCAL schema pattern instead of
+        # EmailStr, which needs the email-validator package at import time
+        sed -i 's/^\(\s*\)EmailStr,$/\1str,/' $PYDANTIC_MODEL
+        sed -i '/^from pydantic import/ s/ EmailStr,//' $PYDANTIC_MODEL
+
+        # Reuse model instances passed to nested fields as-is instead of copying
+        # them on every validation
+        sed -i 's/^\(\s*\)allow_population_by_field_name = True$/&\n\1copy_on_model_validation = "none"/' $PYDANTIC_MODEL
 
         # Get rid of Regex for datatypes other than str - it is redundant and will
         # create an error
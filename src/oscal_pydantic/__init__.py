@@ -1,2 +1,24 @@
+import importlib
+
 # Version
 __version__ = "2023.3.21"
+
+# Model modules are only imported on first access (e.g. oscal_pydantic.catalog),
+# so importing the package does not build every OSCAL schema
+_MODULES = {
+    "assessment_plan",
+    "assessment_results",
+    "catalog",
+    "complete",
+    "component",
+    "poam",
+    "profile",
+    "ssp",
+    "tools",
+}
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
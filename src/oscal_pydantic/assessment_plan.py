@@ -8,13 +8,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Annotated, List, Optional
 
-from pydantic import AnyUrl, EmailStr, Extra, Field
+from pydantic import AnyUrl, Extra, Field
 from pydantic import BaseModel as PydanticBaseModel
 
 
 class BaseModel(PydanticBaseModel):
     class Config:
         allow_population_by_field_name = True
+        copy_on_model_validation = "none"
 
 
 class LocationURL(BaseModel):
@@ -86,7 +87,7 @@ class RoleIdentifierReference(BaseModel):
         str,
         Field(
             description="A human-oriented identifier reference to roles served by the user.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Role Identifier Reference",
         ),
     ]
@@ -130,7 +131,7 @@ class Link(BaseModel):
         Optional[str],
         Field(
             description="Describes the type of relationship provided by the link. This can be an indicator of the link's purpose.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Relation",
         ),
     ] = None
@@ -223,10 +224,10 @@ class OSCALVersion(BaseModel):
 
 class EmailAddress(BaseModel):
     __root__: Annotated[
-        EmailStr,
+        str,
         Field(
             description="An email address as defined by RFC 5322 Section 3.4.1.",
-            # regex="^.+@.+$",
+            regex="^.+@.+$",
             title="Email Address",
         ),
     ]
@@ -402,7 +403,7 @@ class IncludeSpecificStatements(BaseModel):
         str,
         Field(
             description="Used to constrain the selection to only specificity identified statements.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Include Specific Statements",
         ),
     ]
@@ -417,7 +418,7 @@ class SelectControl(BaseModel):
         Field(
             alias="control-id",
             description="A human-oriented identifier reference to a control with a corresponding id value. When referencing an externally defined control, the Control Identifier Reference must be used in the context of the external / imported OSCAL instance (e.g., uri-reference).",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier Reference",
         ),
     ]
@@ -436,7 +437,7 @@ class SelectObjective(BaseModel):
         Field(
             alias="objective-id",
             description="Points to an assessment objective.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Objective ID",
         ),
     ]
@@ -482,7 +483,7 @@ class ObjectiveStatus1(BaseModel):
         Optional[str],
         Field(
             description="The reason the objective was given it's status.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Objective Status Reason",
         ),
     ] = None
@@ -505,7 +506,7 @@ class ObservationType(BaseModel):
         str,
         Field(
             description="Identifies the nature of the observation. More than one may be used to further qualify and enable filtering.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Observation Type",
         ),
     ]
@@ -572,7 +573,7 @@ class LoggedBy(BaseModel):
         Field(
             alias="role-id",
             description="A point to the role-id of the role in which the party is making the log entry.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Actor Role",
         ),
     ] = None
@@ -583,7 +584,7 @@ class RiskStatus(BaseModel):
         str,
         Field(
             description="Describes the status of the associated risk.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Risk Status",
         ),
     ]
@@ -725,7 +726,7 @@ class ImplementationStatus(BaseModel):
         str,
         Field(
             description="Identifies the implementation status of the control or control objective.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Implementation State",
         ),
     ]
@@ -752,7 +753,7 @@ class SetParameterValue(BaseModel):
         Field(
             alias="param-id",
             description="A human-oriented reference to a parameter within a control, who's catalog has been imported into the current implementation context.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter ID",
         ),
     ]
@@ -807,7 +808,7 @@ class Property(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies a specific attribute, characteristic, or quality of the property's containing object.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Property Name",
         ),
     ]
@@ -840,7 +841,7 @@ class Property(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the property's name. This can be used to further distinguish or discriminate between the semantics of multiple properties of the same object with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Property Class",
         ),
     ] = None
@@ -856,7 +857,7 @@ class ResponsibleParty(BaseModel):
         Field(
             alias="role-id",
             description="A human-oriented identifier reference to roles served by the user.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Responsible Role",
         ),
     ]
@@ -875,7 +876,7 @@ class ResponsibleRole(BaseModel):
         Field(
             alias="role-id",
             description="A human-oriented identifier reference to roles responsible for the business function.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Responsible Role ID",
         ),
     ]
@@ -895,7 +896,7 @@ class Address(BaseModel):
         Optional[str],
         Field(
             description="Indicates the type of address.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Address Type",
         ),
     ] = None
@@ -1048,7 +1049,7 @@ class SelectAssessmentSubject(BaseModel):
         str,
         Field(
             description="Used to indicate the type of object pointed to by the uuid-ref within a subject.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Subject Universally Unique Identifier Reference Type",
         ),
     ]
@@ -1074,7 +1075,7 @@ class IdentifiesTheSubject(BaseModel):
         str,
         Field(
             description="Used to indicate the type of object pointed to by the uuid-ref within a subject.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Subject Universally Unique Identifier Reference Type",
         ),
     ]
@@ -1155,7 +1156,7 @@ class ObjectiveStatus(BaseModel):
         Field(
             alias="target-id",
             description="A machine-oriented identifier reference for a specific target qualified by the type.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Finding Target Identifier Reference",
         ),
     ]
@@ -1230,7 +1231,7 @@ class OriginatingActor(BaseModel):
         Field(
             alias="role-id",
             description="For a party, this can optionally be used to specify the role the actor was performing.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Actor Role",
         ),
     ] = None
@@ -1279,7 +1280,7 @@ class Facet(BaseModel):
         str,
         Field(
             description="The name of the risk metric within the specified system.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Facet Name",
         ),
     ]
@@ -1352,7 +1353,7 @@ class AssessmentPart(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies the part's semantic type.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Name",
         ),
     ]
@@ -1369,7 +1370,7 @@ class AssessmentPart(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the part's name. This can be used to further distinguish or discriminate between the semantics of multiple parts of the same control with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Class",
         ),
     ] = None
@@ -1400,7 +1401,7 @@ class Part(BaseModel):
         Optional[str],
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined part elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Identifier",
         ),
     ] = None
@@ -1408,7 +1409,7 @@ class Part(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies the part's semantic type.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Name",
         ),
     ]
@@ -1425,7 +1426,7 @@ class Part(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the part's name. This can be used to further distinguish or discriminate between the semantics of multiple parts of the same control with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Class",
         ),
     ] = None
@@ -1456,7 +1457,7 @@ class Parameter(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined parameter elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter Identifier",
         ),
     ]
@@ -1465,7 +1466,7 @@ class Parameter(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a characterization of the parameter.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter Class",
         ),
     ] = None
@@ -1474,7 +1475,7 @@ class Parameter(BaseModel):
         Field(
             alias="depends-on",
             description="**(deprecated)** Another parameter invoking this one. This construct has been deprecated and should not be used.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Depends on",
         ),
     ] = None
@@ -1736,7 +1737,7 @@ class Role(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined role elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, the locally defined ID of the Role from the imported OSCAL instance must be referenced in the context of the containing resource (e.g., import, import-component-definition, import-profile, import-ssp or import-ap). This ID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Role Identifier",
         ),
     ]
@@ -1841,7 +1842,7 @@ class AssessmentSpecificControlObjective(BaseModel):
         Field(
             alias="control-id",
             description="A human-oriented identifier reference to a control with a corresponding id value. When referencing an externally defined control, the Control Identifier Reference must be used in the context of the external / imported OSCAL instance (e.g., uri-reference).",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier Reference",
         ),
     ]
@@ -1962,7 +1963,7 @@ class SubjectOfAssessment(BaseModel):
         str,
         Field(
             description="Indicates the type of assessment subject, such as a component, inventory, item, location, or party represented by this selection statement.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Subject Type",
         ),
     ]
@@ -2301,7 +2302,7 @@ class Task(BaseModel):
         str,
         Field(
             description="The type of task.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Task Type",
         ),
     ]
@@ -2381,7 +2382,7 @@ class RiskResponse(BaseModel):
         str,
         Field(
             description="Identifies whether this is a recommendation, such as from an assessor or tool, or an actual plan accepted by the system owner.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Remediation Intent",
         ),
     ]
@@ -8,13 +8,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Annotated, List, Optional
 
-from pydantic import AnyUrl, EmailStr, Extra, Field
+from pydantic import AnyUrl, Extra, Field
 from pydantic import BaseModel as PydanticBaseModel
 
 
 class BaseModel(PydanticBaseModel):
     class Config:
         allow_population_by_field_name = True
+        copy_on_model_validation = "none"
 
 
 class Guideline(BaseModel):
@@ -137,7 +138,7 @@ class RoleIdentifierReference(BaseModel):
         str,
         Field(
             description="A human-oriented identifier reference to roles served by the user.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Role Identifier Reference",
         ),
     ]
@@ -181,7 +182,7 @@ class Link(BaseModel):
         Optional[str],
         Field(
             description="Describes the type of relationship provided by the link. This can be an indicator of the link's purpose.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Relation",
         ),
     ] = None
@@ -274,10 +275,10 @@ class OSCALVersion(BaseModel):
 
 class EmailAddress(BaseModel):
     __root__: Annotated[
-        EmailStr,
+        str,
         Field(
             description="An email address as defined by RFC 5322 Section 3.4.1.",
-            # #regex="^.+@.+$",
+            regex="^.+@.+$",
             title="Email Address",
         ),
     ]
@@ -384,7 +385,7 @@ class Property(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies a specific attribute, characteristic, or quality of the property's containing object.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Property Name",
         ),
     ]
@@ -417,7 +418,7 @@ class Property(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the property's name. This can be used to further distinguish or discriminate between the semantics of multiple properties of the same object with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Property Class",
         ),
     ] = None
@@ -433,7 +434,7 @@ class ResponsibleParty(BaseModel):
         Field(
             alias="role-id",
             description="A human-oriented identifier reference to roles served by the user.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Responsible Role",
         ),
     ]
@@ -452,7 +453,7 @@ class ResponsibleRole(BaseModel):
         Field(
             alias="role-id",
             description="A human-oriented identifier reference to roles responsible for the business function.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Responsible Role ID",
         ),
     ]
@@ -472,7 +473,7 @@ class Address(BaseModel):
         Optional[str],
         Field(
             description="Indicates the type of address.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Address Type",
         ),
     ] = None
@@ -522,7 +523,7 @@ class Part(BaseModel):
         Optional[str],
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined part elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Identifier",
         ),
     ] = None
@@ -530,7 +531,7 @@ class Part(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies the part's semantic type.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Name",
         ),
     ]
@@ -547,7 +548,7 @@ class Part(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the part's name. This can be used to further distinguish or discriminate between the semantics of multiple parts of the same control with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Class",
         ),
     ] = None
@@ -578,7 +579,7 @@ class Parameter(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined parameter elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter Identifier",
         ),
     ]
@@ -587,7 +588,7 @@ class Parameter(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a characterization of the parameter.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter Class",
         ),
     ] = None
@@ -596,7 +597,7 @@ class Parameter(BaseModel):
         Field(
             alias="depends-on",
             description="**(deprecated)** Another parameter invoking this one. This construct has been deprecated and should not be used.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Depends on",
         ),
     ] = None
@@ -742,7 +743,7 @@ class Role(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined role elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, the locally defined ID of the Role from the imported OSCAL instance must be referenced in the context of the containing resource (e.g., import, import-component-definition, import-profile, import-ssp or import-ap). This ID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Role Identifier",
         ),
     ]
@@ -846,7 +847,7 @@ class Control(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with instance scope that can be used to reference this control elsewhere in this and other OSCAL instances (e.g., profiles). This id should be assigned per-subject, which means it should be consistently used to identify the same control across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier",
         ),
     ]
@@ -855,7 +856,7 @@ class Control(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the control.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Class",
         ),
     ] = None
@@ -912,7 +913,7 @@ class ControlGroup(BaseModel):
         Optional[str],
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined group elsewhere in in this and other OSCAL instances (e.g., profiles). This id should be assigned per-subject, which means it should be consistently used to identify the same group across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Group Identifier",
         ),
     ] = None
@@ -921,7 +922,7 @@ class ControlGroup(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the group.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Group Class",
         ),
     ] = None
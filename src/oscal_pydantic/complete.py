@@ -8,13 +8,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Annotated, Any, Dict, List, Optional, Union
 
-from pydantic import AnyUrl, EmailStr, Extra, Field
+from pydantic import AnyUrl, Extra, Field
 from pydantic import BaseModel as PydanticBaseModel
 
 
 class BaseModel(PydanticBaseModel):
     class Config:
         allow_population_by_field_name = True
+        copy_on_model_validation = "none"
 
 
 class Guideline(BaseModel):
@@ -137,7 +138,7 @@ class RoleIdentifierReference(BaseModel):
         str,
         Field(
             description="A human-oriented identifier reference to roles served by the user.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Role Identifier Reference",
         ),
     ]
@@ -181,7 +182,7 @@ class Link(BaseModel):
         Optional[str],
         Field(
             description="Describes the type of relationship provided by the link. This can be an indicator of the link's purpose.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Relation",
         ),
     ] = None
@@ -274,10 +275,10 @@ class OSCALVersion(BaseModel):
 
 class EmailAddress(BaseModel):
     __root__: Annotated[
-        EmailStr,
+        str,
         Field(
             description="An email address as defined by RFC 5322 Section 3.4.1.",
-            # regex="^.+@.+$",
+            regex="^.+@.+$",
             title="Email Address",
         ),
     ]
@@ -359,7 +360,7 @@ class MatchControlsByIdentifier(BaseModel):
         str,
         Field(
             description="",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Match Controls by Identifier",
         ),
     ]
@@ -406,7 +407,7 @@ class Removal(BaseModel):
         Field(
             alias="by-name",
             description="Identify items to remove by matching their assigned name",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Reference by (assigned) name",
         ),
     ] = None
@@ -415,7 +416,7 @@ class Removal(BaseModel):
         Field(
             alias="by-class",
             description="Identify items to remove by matching their class.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Reference by class",
         ),
     ] = None
@@ -424,7 +425,7 @@ class Removal(BaseModel):
         Field(
             alias="by-id",
             description="Identify items to remove indicated by their id.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Reference by ID",
         ),
     ] = None
@@ -433,7 +434,7 @@ class Removal(BaseModel):
         Field(
             alias="by-item-name",
             description="Identify items to remove by the name of the item's information element name, e.g. title or prop",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Item Name Reference",
         ),
     ] = None
@@ -442,7 +443,7 @@ class Removal(BaseModel):
         Field(
             alias="by-ns",
             description="Identify items to remove by the item's ns, which is the namespace associated with a part, or prop.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Item Namespace Reference",
         ),
     ] = None
@@ -546,7 +547,7 @@ class ImplementationStatus(BaseModel):
         str,
         Field(
             description="Identifies the implementation status of the control or control objective.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Implementation State",
         ),
     ]
@@ -573,7 +574,7 @@ class SetParameterValue(BaseModel):
         Field(
             alias="param-id",
             description="A human-oriented reference to a parameter within a control, who's catalog has been imported into the current implementation context.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter ID",
         ),
     ]
@@ -726,7 +727,7 @@ class SystemAuthorizationDate(BaseModel):
         str,
         Field(
             description="The date the system received its authorization.",
-            regex="^((2000|2400|2800|(19|2[0-9](0[48]|[2468][048]|[13579][26])))-02-29)|(((19|2[0-9])[0-9]{2})-02-(0[1-9]|1[0-9]|2[0-8]))|(((19|2[0-9])[0-9]{2})-(0[13578]|10|12)-(0[1-9]|[12][0-9]|3[01]))|(((19|2[0-9])[0-9]{2})-(0[469]|11)-(0[1-9]|[12][0-9]|30))(Z|[+-][0-9]{2}:[0-9]{2})?$",
+            regex="^(((2000|2400|2800|(19|2[0-9](0[48]|[2468][048]|[13579][26])))-02-29)|(((19|2[0-9])[0-9]{2})-02-(0[1-9]|1[0-9]|2[0-8]))|(((19|2[0-9])[0-9]{2})-(0[13578]|10|12)-(0[1-9]|[12][0-9]|3[01]))|(((19|2[0-9])[0-9]{2})-(0[469]|11)-(0[1-9]|[12][0-9]|30)))(Z|[+-][0-9]{2}:[0-9]{2})?$",
             title="System Authorization Date",
         ),
     ]
@@ -861,7 +862,7 @@ class IncludeSpecificStatements(BaseModel):
         str,
         Field(
             description="Used to constrain the selection to only specificity identified statements.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Include Specific Statements",
         ),
     ]
@@ -876,7 +877,7 @@ class SelectControl(BaseModel):
         Field(
             alias="control-id",
             description="A human-oriented identifier reference to a control with a corresponding id value. When referencing an externally defined control, the Control Identifier Reference must be used in the context of the external / imported OSCAL instance (e.g., uri-reference).",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier Reference",
         ),
     ]
@@ -895,7 +896,7 @@ class SelectObjective(BaseModel):
         Field(
             alias="objective-id",
             description="Points to an assessment objective.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Objective ID",
         ),
     ]
@@ -941,7 +942,7 @@ class ObjectiveStatus1(BaseModel):
         Optional[str],
         Field(
             description="The reason the objective was given it's status.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Objective Status Reason",
         ),
     ] = None
@@ -964,7 +965,7 @@ class ObservationType(BaseModel):
         str,
         Field(
             description="Identifies the nature of the observation. More than one may be used to further qualify and enable filtering.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Observation Type",
         ),
     ]
@@ -1031,7 +1032,7 @@ class LoggedBy(BaseModel):
         Field(
             alias="role-id",
             description="A point to the role-id of the role in which the party is making the log entry.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Actor Role",
         ),
     ] = None
@@ -1042,7 +1043,7 @@ class RiskStatus(BaseModel):
         str,
         Field(
             description="Describes the status of the associated risk.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Risk Status",
         ),
     ]
@@ -1137,7 +1138,7 @@ class Property(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies a specific attribute, characteristic, or quality of the property's containing object.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Property Name",
         ),
     ]
@@ -1170,7 +1171,7 @@ class Property(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the property's name. This can be used to further distinguish or discriminate between the semantics of multiple properties of the same object with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Property Class",
         ),
     ] = None
@@ -1186,7 +1187,7 @@ class ResponsibleParty(BaseModel):
         Field(
             alias="role-id",
             description="A human-oriented identifier reference to roles served by the user.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Responsible Role",
         ),
     ]
@@ -1205,7 +1206,7 @@ class ResponsibleRole(BaseModel):
         Field(
             alias="role-id",
             description="A human-oriented identifier reference to roles responsible for the business function.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Responsible Role ID",
         ),
     ]
@@ -1225,7 +1226,7 @@ class Address(BaseModel):
         Optional[str],
         Field(
             description="Indicates the type of address.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Address Type",
         ),
     ] = None
@@ -1296,7 +1297,7 @@ class ParameterSetting(BaseModel):
         Field(
             alias="param-id",
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined parameter elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter ID",
         ),
     ]
@@ -1305,7 +1306,7 @@ class ParameterSetting(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a characterization of the parameter.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter Class",
         ),
     ] = None
@@ -1314,7 +1315,7 @@ class ParameterSetting(BaseModel):
         Field(
             alias="depends-on",
             description="**(deprecated)** Another parameter invoking this one. This construct has been deprecated and should not be used.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Depends on",
         ),
     ] = None
@@ -1369,7 +1370,7 @@ class ControlStatementImplementation(BaseModel):
         Field(
             alias="statement-id",
             description="A human-oriented identifier reference to a control statement.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Statement Reference",
         ),
     ]
@@ -2023,7 +2024,7 @@ class SelectAssessmentSubject(BaseModel):
         str,
         Field(
             description="Used to indicate the type of object pointed to by the uuid-ref within a subject.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Subject Universally Unique Identifier Reference Type",
         ),
     ]
@@ -2049,7 +2050,7 @@ class IdentifiesTheSubject(BaseModel):
         str,
         Field(
             description="Used to indicate the type of object pointed to by the uuid-ref within a subject.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Subject Universally Unique Identifier Reference Type",
         ),
     ]
@@ -2130,7 +2131,7 @@ class ObjectiveStatus(BaseModel):
         Field(
             alias="target-id",
             description="A machine-oriented identifier reference for a specific target qualified by the type.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Finding Target Identifier Reference",
         ),
     ]
@@ -2205,7 +2206,7 @@ class OriginatingActor(BaseModel):
         Field(
             alias="role-id",
             description="For a party, this can optionally be used to specify the role the actor was performing.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Actor Role",
         ),
     ] = None
@@ -2254,7 +2255,7 @@ class Facet(BaseModel):
         str,
         Field(
             description="The name of the risk metric within the specified system.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Facet Name",
         ),
     ]
@@ -2327,7 +2328,7 @@ class AssessmentPart(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies the part's semantic type.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Name",
         ),
     ]
@@ -2344,7 +2345,7 @@ class AssessmentPart(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the part's name. This can be used to further distinguish or discriminate between the semantics of multiple parts of the same control with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Class",
         ),
     ] = None
@@ -2432,7 +2433,7 @@ class Part(BaseModel):
         Optional[str],
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined part elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Identifier",
         ),
     ] = None
@@ -2440,7 +2441,7 @@ class Part(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies the part's semantic type.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Name",
         ),
     ]
@@ -2457,7 +2458,7 @@ class Part(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the part's name. This can be used to further distinguish or discriminate between the semantics of multiple parts of the same control with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Class",
         ),
     ] = None
@@ -2488,7 +2489,7 @@ class Parameter(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined parameter elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter Identifier",
         ),
     ]
@@ -2497,7 +2498,7 @@ class Parameter(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a characterization of the parameter.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter Class",
         ),
     ] = None
@@ -2506,7 +2507,7 @@ class Parameter(BaseModel):
         Field(
             alias="depends-on",
             description="**(deprecated)** Another parameter invoking this one. This construct has been deprecated and should not be used.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Depends on",
         ),
     ] = None
@@ -2652,7 +2653,7 @@ class Role(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined role elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, the locally defined ID of the Role from the imported OSCAL instance must be referenced in the context of the containing resource (e.g., import, import-component-definition, import-profile, import-ssp or import-ap). This ID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Role Identifier",
         ),
     ]
@@ -2756,7 +2757,7 @@ class ControlGroup1(BaseModel):
         Optional[str],
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined group elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same group across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Group Identifier",
         ),
     ] = None
@@ -2765,7 +2766,7 @@ class ControlGroup1(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the group.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Group Class",
         ),
     ] = None
@@ -2802,7 +2803,7 @@ class Addition(BaseModel):
         Field(
             alias="by-id",
             description="Target location of the addition.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Reference by ID",
         ),
     ] = None
@@ -2836,7 +2837,7 @@ class ControlImplementation(BaseModel):
         Field(
             alias="control-id",
             description="A human-oriented identifier reference to a control with a corresponding id value. When referencing an externally defined control, the Control Identifier Reference must be used in the context of the external / imported OSCAL instance (e.g., uri-reference).",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier Reference",
         ),
     ]
@@ -3006,7 +3007,7 @@ class SpecificControlStatement(BaseModel):
         Field(
             alias="statement-id",
             description="A human-oriented identifier reference to a control statement.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Statement Reference",
         ),
     ]
@@ -3046,7 +3047,7 @@ class AssessmentSpecificControlObjective(BaseModel):
         Field(
             alias="control-id",
             description="A human-oriented identifier reference to a control with a corresponding id value. When referencing an externally defined control, the Control Identifier Reference must be used in the context of the external / imported OSCAL instance (e.g., uri-reference).",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier Reference",
         ),
     ]
@@ -3167,7 +3168,7 @@ class SubjectOfAssessment(BaseModel):
         str,
         Field(
             description="Indicates the type of assessment subject, such as a component, inventory, item, location, or party represented by this selection statement.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Subject Type",
         ),
     ]
@@ -3413,7 +3414,7 @@ class Control(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with instance scope that can be used to reference this control elsewhere in this and other OSCAL instances (e.g., profiles). This id should be assigned per-subject, which means it should be consistently used to identify the same control across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier",
         ),
     ]
@@ -3422,7 +3423,7 @@ class Control(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the control.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Class",
         ),
     ] = None
@@ -3522,7 +3523,7 @@ class Alteration(BaseModel):
         Field(
             alias="control-id",
             description="A human-oriented identifier reference to a control with a corresponding id value. When referencing an externally defined control, the Control Identifier Reference must be used in the context of the external / imported OSCAL instance (e.g., uri-reference).",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier Reference",
         ),
     ]
@@ -3639,7 +3640,7 @@ class ControlBasedRequirement(BaseModel):
         Field(
             alias="control-id",
             description="A human-oriented identifier reference to a control with a corresponding id value. When referencing an externally defined control, the Control Identifier Reference must be used in the context of the external / imported OSCAL instance (e.g., uri-reference).",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier Reference",
         ),
     ]
@@ -3714,7 +3715,7 @@ class Task(BaseModel):
         str,
         Field(
             description="The type of task.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Task Type",
         ),
     ]
@@ -3784,7 +3785,7 @@ class RiskResponse(BaseModel):
         str,
         Field(
             description="Identifies whether this is a recommendation, such as from an assessor or tool, or an actual plan accepted by the system owner.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Remediation Intent",
         ),
     ]
@@ -3875,7 +3876,7 @@ class ControlGroup(BaseModel):
         Optional[str],
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined group elsewhere in in this and other OSCAL instances (e.g., profiles). This id should be assigned per-subject, which means it should be consistently used to identify the same group across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Group Identifier",
         ),
     ] = None
@@ -3884,7 +3885,7 @@ class ControlGroup(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the group.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Group Class",
         ),
     ] = None
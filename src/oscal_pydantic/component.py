@@ -8,13 +8,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Annotated, List, Optional
 
-from pydantic import AnyUrl, EmailStr, Extra, Field
+from pydantic import AnyUrl, Extra, Field
 from pydantic import BaseModel as PydanticBaseModel
 
 
 class BaseModel(PydanticBaseModel):
     class Config:
         allow_population_by_field_name = True
+        copy_on_model_validation = "none"
 
 
 class ImportComponentDefinition(BaseModel):
@@ -199,7 +200,7 @@ class RoleIdentifierReference(BaseModel):
         str,
         Field(
             description="A human-oriented identifier reference to roles served by the user.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Role Identifier Reference",
         ),
     ]
@@ -243,7 +244,7 @@ class Link(BaseModel):
         Optional[str],
         Field(
             description="Describes the type of relationship provided by the link. This can be an indicator of the link's purpose.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Relation",
         ),
     ] = None
@@ -336,10 +337,10 @@ class OSCALVersion(BaseModel):
 
 class EmailAddress(BaseModel):
     __root__: Annotated[
-        EmailStr,
+        str,
         Field(
             description="An email address as defined by RFC 5322 Section 3.4.1.",
-            # regex="^.+@.+$",
+            regex="^.+@.+$",
             title="Email Address",
         ),
     ]
@@ -503,7 +504,7 @@ class ImplementationStatus(BaseModel):
         str,
         Field(
             description="Identifies the implementation status of the control or control objective.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Implementation State",
         ),
     ]
@@ -542,7 +543,7 @@ class SetParameterValue(BaseModel):
         Field(
             alias="param-id",
             description="A human-oriented reference to a parameter within a control, who's catalog has been imported into the current implementation context.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter ID",
         ),
     ]
@@ -581,7 +582,7 @@ class Property(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies a specific attribute, characteristic, or quality of the property's containing object.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Property Name",
         ),
     ]
@@ -614,7 +615,7 @@ class Property(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the property's name. This can be used to further distinguish or discriminate between the semantics of multiple properties of the same object with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Property Class",
         ),
     ] = None
@@ -630,7 +631,7 @@ class ResponsibleParty(BaseModel):
         Field(
             alias="role-id",
             description="A human-oriented identifier reference to roles served by the user.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Responsible Role",
         ),
     ]
@@ -649,7 +650,7 @@ class ResponsibleRole(BaseModel):
         Field(
             alias="role-id",
             description="A human-oriented identifier reference to roles responsible for the business function.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Responsible Role ID",
         ),
     ]
@@ -669,7 +670,7 @@ class Address(BaseModel):
         Optional[str],
         Field(
             description="Indicates the type of address.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Address Type",
         ),
     ] = None
@@ -719,7 +720,7 @@ class Part(BaseModel):
         Optional[str],
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined part elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Identifier",
         ),
     ] = None
@@ -727,7 +728,7 @@ class Part(BaseModel):
         str,
         Field(
             description="A textual label that uniquely identifies the part's semantic type.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Name",
         ),
     ]
@@ -744,7 +745,7 @@ class Part(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a sub-type or characterization of the part's name. This can be used to further distinguish or discriminate between the semantics of multiple parts of the same control with the same name and ns.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Part Class",
         ),
     ] = None
@@ -775,7 +776,7 @@ class Parameter(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined parameter elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter Identifier",
         ),
     ]
@@ -784,7 +785,7 @@ class Parameter(BaseModel):
         Field(
             alias="class",
             description="A textual label that provides a characterization of the parameter.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Parameter Class",
         ),
     ] = None
@@ -793,7 +794,7 @@ class Parameter(BaseModel):
         Field(
             alias="depends-on",
             description="**(deprecated)** Another parameter invoking this one. This construct has been deprecated and should not be used.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Depends on",
         ),
     ] = None
@@ -829,7 +830,7 @@ class ControlStatementImplementation(BaseModel):
         Field(
             alias="statement-id",
             description="A human-oriented identifier reference to a control statement.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Statement Reference",
         ),
     ]
@@ -1132,7 +1133,7 @@ class Role(BaseModel):
         str,
         Field(
             description="A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined role elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, the locally defined ID of the Role from the imported OSCAL instance must be referenced in the context of the containing resource (e.g., import, import-component-definition, import-profile, import-ssp or import-ap). This ID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Role Identifier",
         ),
     ]
@@ -1245,7 +1246,7 @@ class ControlImplementation(BaseModel):
         Field(
             alias="control-id",
             description="A human-oriented identifier reference to a control with a corresponding id value. When referencing an externally defined control, the Control Identifier Reference must be used in the context of the external / imported OSCAL instance (e.g., uri-reference).",
-            regex="^(\\w|_)(\\w|\\d|[.\\--_])*$",
+            regex="^[^\\W\\d][\\w.\\-]*$",
             title="Control Identifier Reference",
         ),
     ]
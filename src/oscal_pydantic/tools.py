@@ -0,0 +1,150 @@
+import hashlib
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Type, TypeVar
+
+from pydantic import BaseModel, create_model
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.utils import lenient_issubclass
+
+Model = TypeVar("Model", bound=BaseModel)
+
+# OSCAL hash algorithm names mapped to their hashlib equivalents
+HASH_ALGORITHMS = {
+    "SHA-224": "sha224",
+    "SHA-256": "sha256",
+    "SHA-384": "sha384",
+    "SHA-512": "sha512",
+    "SHA3-224": "sha3_224",
+    "SHA3-256": "sha3_256",
+    "SHA3-384": "sha3_384",
+    "SHA3-512": "sha3_512",
+}
+
+
+def construct_trusted(model: Type[Model], obj: Any) -> Model:
+    """
+    Build an instance of an OSCAL model from already-validated data without
+    running validation.
+
+    Unlike pydantic's Model.construct(), nested models (and lists of models)
+    are constructed recursively, so data previously produced by .dict() or
+    .json() on a validated document can be reloaded cheaply. Only use this
+    with data from a trusted source; nothing is checked.
+    """
+    if isinstance(obj, model):
+        return obj
+    if model.__custom_root_type__:
+        return model.construct(
+            __root__=_construct_field(model.__fields__["__root__"], obj)
+        )
+
+    values: Dict[str, Any] = {}
+    for name, field in model.__fields__.items():
+        if field.alias in obj:
+            values[name] = _construct_field(field, obj[field.alias])
+        elif name in obj:
+            values[name] = _construct_field(field, obj[name])
+    return model.construct(**values)
+
+
+def _construct_field(field: ModelField, value: Any) -> Any:
+    if value is None:
+        return None
+    if field.shape == SHAPE_SINGLETON:
+        if field.sub_fields:
+            return _construct_union(field, value)
+        return _construct_item(field.type_, value)
+    if field.shape == SHAPE_LIST:
+        return [_construct_item(field.type_, item) for item in value]
+    return value
+
+
+def _construct_item(type_: Any, value: Any) -> Any:
+    if lenient_issubclass(type_, BaseModel):
+        return construct_trusted(type_, value)
+    if lenient_issubclass(type_, Enum):
+        return type_(value)
+    if lenient_issubclass(type_, datetime):
+        return parse_datetime(value)
+    return value
+
+
+def _construct_union(field: ModelField, value: Any) -> Any:
+    # Union members are not tried against the data, so the member must be
+    # identifiable from the keys alone (e.g. complete.Model's document types)
+    if isinstance(value, dict):
+        for sub_field in field.sub_fields:
+            type_ = sub_field.type_
+            if lenient_issubclass(type_, BaseModel) and _has_fields(type_, value):
+                return construct_trusted(type_, value)
+    raise TypeError(f"No member of the {field.name} union matches the given keys")
+
+
+def _has_fields(model: Type[BaseModel], obj: Dict[str, Any]) -> bool:
+    fields = model.__fields__.values()
+    keys = {field.alias for field in fields} | {field.name for field in fields}
+    return all(key in keys for key in obj) and all(
+        field.alias in obj or field.name in obj for field in fields if field.required
+    )
+
+
+def parse_list(model: Type[Model], obj: Any) -> List[Model]:
+    """
+    Validate a list of OSCAL objects (e.g. links, hashes or properties) in one
+    call. The wrapping list model is built once per model class and reused.
+    """
+    return _list_model(model).parse_obj(obj).__root__
+
+
+@lru_cache(maxsize=None)
+def _list_model(model: Type[Model]) -> Type[BaseModel]:
+    return create_model(f"{model.__name__}List", __root__=(List[model], ...))
+
+
+def verify_hash(hash_: Any, data: bytes) -> bool:
+    """
+    Check that data matches an OSCAL Hash (from any of the model modules).
+
+    The digest is computed by hashlib in a single update() call, so OpenSSL's
+    accelerated implementations are used where available.
+    """
+    try:
+        name = HASH_ALGORITHMS[hash_.algorithm]
+    except KeyError:
+        raise ValueError(f"Unsupported hash algorithm: {hash_.algorithm}") from None
+    digest = hashlib.new(name, memoryview(data)).hexdigest()
+    return digest == hash_.value.lower()
+
+
+def parse_document(obj: Any) -> BaseModel:
+    """
+    Validate a complete OSCAL document (catalog, profile, SSP, ...).
+
+    complete.Model is a Union of one wrapper model per document type, which
+    pydantic tries in order. This picks the wrapper from the document's
+    top-level key and validates against that model only. Anything else (no
+    recognised key, or not a JSON object at all) falls back to complete.Model
+    so the usual errors are raised.
+    """
+    if isinstance(obj, dict):
+        document_models = _document_models()
+        for key in obj:
+            if key in document_models:
+                return document_models[key].parse_obj(obj)
+
+    from oscal_pydantic import complete
+
+    return complete.Model.parse_obj(obj).__root__
+
+
+@lru_cache(maxsize=None)
+def _document_models() -> Dict[str, Type[BaseModel]]:
+    from oscal_pydantic import complete
+
+    return {
+        next(iter(field.type_.__fields__.values())).alias: field.type_
+        for field in complete.Model.__fields__["__root__"].sub_fields
+    }
@@ -11,16 +11,24 @@ from oscal_pydantic import (
     poam,
     profile,
     ssp,
+    tools,
 )
 
+if __name__ == "__main__":
+    catalog_metadata = catalog.PublicationMetadata(
+        title="Common Policy",
+        last_modified=catalog.LastModifiedTimestamp.parse_obj(datetime.datetime.now()),
+        version=catalog.DocumentVersion.parse_obj("1.0"),
+        oscal_version=catalog.OSCALVersion.parse_obj("1.0.4"),
+    )
 
-catalog_metadata = catalog.PublicationMetadata(
-    title="Common Policy",
-    last_modified=catalog.LastModifiedTimestamp.parse_obj(datetime.datetime.now()),
-    version=catalog.DocumentVersion.parse_obj("1.0"),
-    oscal_version=catalog.OSCALVersion.parse_obj("1.0.4"),
-)
+    catalog_model = catalog.Catalog(uuid=str(uuid.uuid4()), metadata=catalog_metadata)
 
-catalog = catalog.Catalog(uuid=str(uuid.uuid4()), metadata=catalog_metadata)
+    print(catalog_model.json())
 
-print(catalog.json())
+    # Reloading trusted data must give the same models as validating it
+    document = json.loads(catalog.Model(catalog=catalog_model).json(by_alias=True))
+    trusted_catalog = tools.construct_trusted(catalog.Model, document)
+    assert trusted_catalog == catalog.Model.parse_obj(document)
+    trusted_document = tools.construct_trusted(complete.Model, document)
+    assert trusted_document == complete.Model.parse_obj(document)